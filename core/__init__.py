@@ -76,6 +76,7 @@ from core.safety import (
     SafetyVerdict,
     ThreatCategory,
     get_safety_judge,
+    quick_screen_batch,
     quick_screen_input,
     quick_screen_output,
 )
@@ -141,6 +142,7 @@ __all__ = [
     "SafetyResult",
     "ThreatCategory",
     "get_safety_judge",
+    "quick_screen_batch",
     "quick_screen_input",
     "quick_screen_output",
     "BLOCKED_RESPONSE",
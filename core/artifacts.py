@@ -441,6 +441,22 @@ class ArtifactHelper:
             logger.warning("Artifact service not configured")
             return []
 
+    async def list_by_scope(self) -> tuple[list[str], list[str]]:
+        """
+        List artifacts split into session-scoped and user-scoped filenames.
+
+        Fetches the listing once and partitions it in a single pass, for
+        callers that need both scopes.
+
+        Returns:
+            Tuple of (session-scoped filenames, user-scoped filenames)
+        """
+        session_artifacts: list[str] = []
+        user_artifacts: list[str] = []
+        for f in await self.list_all():
+            (user_artifacts if f.startswith("user:") else session_artifacts).append(f)
+        return session_artifacts, user_artifacts
+
     async def list_session_artifacts(self) -> list[str]:
         """
         List only session-scoped artifacts (no user: prefix).
@@ -448,8 +464,8 @@ class ArtifactHelper:
         Returns:
             List of session-scoped artifact filenames
         """
-        all_artifacts = await self.list_all()
-        return [f for f in all_artifacts if not f.startswith("user:")]
+        session_artifacts, _ = await self.list_by_scope()
+        return session_artifacts
 
     async def list_user_artifacts(self) -> list[str]:
         """
@@ -458,8 +474,8 @@ class ArtifactHelper:
         Returns:
             List of user-scoped artifact filenames
         """
-        all_artifacts = await self.list_all()
-        return [f for f in all_artifacts if f.startswith("user:")]
+        _, user_artifacts = await self.list_by_scope()
+        return user_artifacts
 
     # -------------------------------------------------------------------------
     # Existence Check
@@ -516,35 +532,39 @@ async def save_rca_report(
     return versions
 
 
+def _markdown_timeline(events: list[dict[str, Any]]) -> list[str]:
+    """Render timeline events as Markdown list items."""
+    return [
+        f"- **{event.get('time', 'Unknown')}**: {event.get('description', '')}" for event in events
+    ]
+
+
+def _markdown_bullets(items: list[Any]) -> list[str]:
+    """Render items as a Markdown bullet list."""
+    return [f"- {item}" for item in items]
+
+
+# RCA Markdown layout: title lines, then (report key, header, renderer) per
+# section in output order
+_RCA_MARKDOWN_TITLE = ("# Root Cause Analysis Report", "")
+_RCA_MARKDOWN_SECTIONS = (
+    ("summary", "## Summary", lambda text: [text]),
+    ("root_cause", "## Root Cause", lambda text: [text]),
+    ("timeline", "## Timeline", _markdown_timeline),
+    ("recommendations", "## Recommendations", _markdown_bullets),
+    ("affected_systems", "## Affected Systems", _markdown_bullets),
+)
+
+
 def _format_rca_as_markdown(report: dict[str, Any]) -> str:
     """Format RCA report data as Markdown."""
-    lines = ["# Root Cause Analysis Report", ""]
-
-    if "summary" in report:
-        lines.extend(["## Summary", "", report["summary"], ""])
-
-    if "root_cause" in report:
-        lines.extend(["## Root Cause", "", report["root_cause"], ""])
-
-    if "timeline" in report:
-        lines.extend(["## Timeline", ""])
-        for event in report.get("timeline", []):
-            time_str = event.get("time", "Unknown")
-            description = event.get("description", "")
-            lines.append(f"- **{time_str}**: {description}")
-        lines.append("")
-
-    if "recommendations" in report:
-        lines.extend(["## Recommendations", ""])
-        for rec in report.get("recommendations", []):
-            lines.append(f"- {rec}")
-        lines.append("")
-
-    if "affected_systems" in report:
-        lines.extend(["## Affected Systems", ""])
-        for system in report.get("affected_systems", []):
-            lines.append(f"- {system}")
-        lines.append("")
+    lines = list(_RCA_MARKDOWN_TITLE)
+
+    for key, header, render in _RCA_MARKDOWN_SECTIONS:
+        if key in report:
+            lines.extend((header, ""))
+            lines.extend(render(report[key]))
+            lines.append("")
 
     return "\n".join(lines)
 
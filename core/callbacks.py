@@ -106,6 +106,46 @@ def get_sensitive_patterns() -> list[str]:
     return [p["pattern"] for p in patterns if isinstance(p, dict) and "pattern" in p]
 
 
+# A global inline flag such as "(?i)" must start the whole expression, so a
+# pattern using one cannot be wrapped into a larger alternation
+_GLOBAL_INLINE_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=2)
+def _compile_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[re.Pattern | None, tuple[re.Pattern, ...]]:
+    """Compile patterns individually, plus one alternation when they can be fused.
+
+    The alternation gives a single scan per request; the individual regexes
+    are only consulted after a hit, to report the first configured pattern
+    that matched. Patterns that fail to compile are logged and skipped. The
+    alternation is None when any pattern has capture groups (fusing would
+    renumber backreferences) or global inline flags, and callers then fall
+    back to the individual regexes.
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            logger.warning(f"Skipping invalid security pattern {pattern!r}: {e}")
+
+    if any(regex.groups or _GLOBAL_INLINE_FLAGS_RE.search(regex.pattern) for regex in compiled):
+        return None, tuple(compiled)
+
+    combined = "|".join(f"(?:{regex.pattern})" for regex in compiled) or r"(?!)"
+    return re.compile(combined, re.IGNORECASE), tuple(compiled)
+
+
+def _match_pattern(patterns: list[str], text: str) -> str | None:
+    """Return the first pattern in ``patterns`` that matches ``text``, if any."""
+    combined, compiled = _compile_patterns(tuple(patterns))
+    if combined is not None and not combined.search(text):
+        return None
+    return next((regex.pattern for regex in compiled if regex.search(text)), None)
+
+
 def get_host_aware_tools() -> list[str]:
     """Get list of tools that require host parameter."""
     config = _get_config()
@@ -250,49 +290,48 @@ def input_validation_callback(
     if not hasattr(llm_request, "contents"):
         return None
 
-    # Extract user text from request
-    user_text = ""
-    for content in llm_request.contents:
-        if hasattr(content, "parts"):
-            for part in content.parts:
-                if hasattr(part, "text") and part.text:
-                    user_text += part.text + " "
-
-    user_text = user_text.lower()
+    # Extract user text from request; patterns are case-insensitive, so the
+    # joined text is scanned as-is
+    user_text = " ".join(
+        part.text
+        for content in llm_request.contents
+        for part in getattr(content, "parts", None) or ()
+        if getattr(part, "text", None)
+    )
 
     # Check for blocked patterns (most dangerous)
-    for pattern in get_blocked_patterns():
-        if re.search(pattern, user_text, re.IGNORECASE):
-            logger.error(f"Blocked dangerous pattern detected: {pattern}")
-            callback_context.state["security_warning"] = f"Blocked pattern detected: {pattern}"
-            # In production, block the request by returning an LlmResponse
-            if settings.ENVIRONMENT == "production" and ADK_TYPES_AVAILABLE:
-                try:
-                    from google.genai import types
-
-                    return LlmResponse(
-                        content=types.Content(
-                            role="model",
-                            parts=[
-                                types.Part(
-                                    text=(
-                                        "I cannot process this request as it contains potentially "
-                                        "dangerous commands. Please rephrase your request."
-                                    )
+    pattern = _match_pattern(get_blocked_patterns(), user_text)
+    if pattern is not None:
+        logger.error(f"Blocked dangerous pattern detected: {pattern}")
+        callback_context.state["security_warning"] = f"Blocked pattern detected: {pattern}"
+        # In production, block the request by returning an LlmResponse
+        if settings.ENVIRONMENT == "production" and ADK_TYPES_AVAILABLE:
+            try:
+                from google.genai import types
+
+                return LlmResponse(
+                    content=types.Content(
+                        role="model",
+                        parts=[
+                            types.Part(
+                                text=(
+                                    "I cannot process this request as it contains potentially "
+                                    "dangerous commands. Please rephrase your request."
                                 )
-                            ],
-                        )
+                            )
+                        ],
                     )
-                except ImportError:
-                    pass
-            return None  # In development, just log and continue
+                )
+            except ImportError:
+                pass
+        return None  # In development, just log and continue
 
     # Check for sensitive patterns (warn only)
-    for pattern in get_sensitive_patterns():
-        if re.search(pattern, user_text, re.IGNORECASE):
-            logger.warning(f"Sensitive pattern detected: {pattern}")
-            callback_context.state["security_warning"] = f"Sensitive operation detected: {pattern}"
-            return None  # Just warn, don't block
+    pattern = _match_pattern(get_sensitive_patterns(), user_text)
+    if pattern is not None:
+        logger.warning(f"Sensitive pattern detected: {pattern}")
+        callback_context.state["security_warning"] = f"Sensitive operation detected: {pattern}"
+        return None  # Just warn, don't block
 
     return None  # Allow the LLM call to proceed
 
@@ -529,6 +568,14 @@ def create_callbacks_for_agent(include_safety: bool = True) -> dict[str, Any]:
     Returns:
         Dictionary with callback function references for Agent constructor.
     """
+    # The callbacks keep all their state in the context, so the closures can
+    # be shared; hand out a copy so callers may still edit their dict.
+    return dict(_build_callbacks(include_safety))
+
+
+@lru_cache(maxsize=2)
+def _build_callbacks(include_safety: bool) -> dict[str, Any]:
+    """Build the callback dictionary once per ``include_safety`` value."""
     from core.safety import (
         create_safety_screening_callback,
         create_tool_safety_callback,
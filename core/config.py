@@ -31,6 +31,9 @@ MODEL_CLAUDE_SONNET = "anthropic/claude-sonnet-4-20250514"
 MODEL_CLAUDE_OPUS = "anthropic/claude-opus-4-20250514"
 MODEL_CLAUDE_3_5_SONNET = "anthropic/claude-3-5-sonnet-20241022"
 
+# Provider prefixes that route a model through LiteLLM
+_LITELLM_PREFIXES = ("openai/", "anthropic/", "azure/", "cohere/", "huggingface/")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
@@ -172,8 +175,7 @@ class Settings(BaseSettings):
         Returns:
             True if model needs LiteLLM wrapper
         """
-        litellm_prefixes = ["openai/", "anthropic/", "azure/", "cohere/", "huggingface/"]
-        return any(model.startswith(prefix) for prefix in litellm_prefixes)
+        return model.startswith(_LITELLM_PREFIXES)
 
     def get_available_providers(self) -> dict[str, bool]:
         """Check which LLM providers have API keys configured.
@@ -445,7 +445,13 @@ def log_event(event: Any, level: int = logging.DEBUG) -> EventInfo:
         Parsed EventInfo.
     """
     info = classify_event(event)
+    if logger.isEnabledFor(level):
+        logger.log(level, _format_log_line(info))
+    return info
+
 
+def _format_log_line(info: EventInfo) -> str:
+    """Build the single-line log message for a parsed event."""
     log_parts = [
         f"[{info.event_type.value}]",
         f"author={info.author}",
@@ -476,8 +482,7 @@ def log_event(event: Any, level: int = logging.DEBUG) -> EventInfo:
     if info.is_final:
         log_parts.append("FINAL")
 
-    logger.log(level, " ".join(log_parts))
-    return info
+    return " ".join(log_parts)
 
 
 def format_event_summary(event: Any) -> str:
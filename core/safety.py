@@ -28,6 +28,7 @@ The judge runs asynchronously and can be integrated via callbacks.
 
 import logging
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -75,9 +76,9 @@ class ThreatCategory(Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SafetyResult:
-    """Result from the safety judge."""
+    """Result from the safety judge (immutable, so fixed results can be shared)."""
 
     verdict: SafetyVerdict
     threat_category: ThreatCategory
@@ -86,6 +87,37 @@ class SafetyResult:
     should_block: bool
 
 
+# Shared results for outcomes that never vary (SafetyResult is immutable)
+_SAFE_INPUT_RESULT = SafetyResult(
+    verdict=SafetyVerdict.SAFE,
+    threat_category=ThreatCategory.NONE,
+    reason="No obvious threats detected",
+    confidence=0.7,
+    should_block=False,
+)
+_SAFE_OUTPUT_RESULT = SafetyResult(
+    verdict=SafetyVerdict.SAFE,
+    threat_category=ThreatCategory.NONE,
+    reason="No PII detected",
+    confidence=0.8,
+    should_block=False,
+)
+_SCREENING_DISABLED_RESULT = SafetyResult(
+    verdict=SafetyVerdict.SAFE,
+    threat_category=ThreatCategory.NONE,
+    reason="Safety screening disabled",
+    confidence=1.0,
+    should_block=False,
+)
+_JUDGE_UNAVAILABLE_RESULT = SafetyResult(
+    verdict=SafetyVerdict.UNKNOWN,
+    threat_category=ThreatCategory.NONE,
+    reason="Judge unavailable",
+    confidence=0.0,
+    should_block=False,
+)
+
+
 # =============================================================================
 # Safety Judge Prompts
 # =============================================================================
@@ -161,6 +193,12 @@ REASON: [Brief explanation]
 # Safety Judge Implementation
 # =============================================================================
 
+# One "FIELD: value" line of the judge's response format
+_RESPONSE_FIELD_RE = re.compile(r"^[ \t]*(VERDICT|CATEGORY|CONFIDENCE|REASON):(.*)$", re.MULTILINE)
+
+# Verdicts the judge may return; anything else leaves the verdict unchanged
+_JUDGE_VERDICTS = {"SAFE": SafetyVerdict.SAFE, "UNSAFE": SafetyVerdict.UNSAFE}
+
 
 class GeminiSafetyJudge:
     """
@@ -202,37 +240,30 @@ class GeminiSafetyJudge:
 
     def _parse_response(self, response_text: str) -> SafetyResult:
         """Parse the judge's response into a SafetyResult."""
-        lines = response_text.strip().split("\n")
-
         verdict = SafetyVerdict.UNKNOWN
         category = ThreatCategory.NONE
         confidence = 0.5
         reason = "Could not parse response"
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith("VERDICT:"):
-                verdict_str = line.replace("VERDICT:", "").strip().upper()
-                if verdict_str == "SAFE":
-                    verdict = SafetyVerdict.SAFE
-                elif verdict_str == "UNSAFE":
-                    verdict = SafetyVerdict.UNSAFE
-            elif line.startswith("CATEGORY:"):
-                category_str = line.replace("CATEGORY:", "").strip().lower()
+        for match in _RESPONSE_FIELD_RE.finditer(response_text):
+            field_name, value = match.group(1), match.group(2).strip()
+            if field_name == "VERDICT":
+                verdict = _JUDGE_VERDICTS.get(value.upper(), verdict)
+            elif field_name == "CATEGORY":
                 try:
-                    category = ThreatCategory(category_str)
+                    category = ThreatCategory(value.lower())
                 except ValueError:
                     category = ThreatCategory.NONE
-            elif line.startswith("CONFIDENCE:"):
+            elif field_name == "CONFIDENCE":
                 try:
-                    confidence = float(line.replace("CONFIDENCE:", "").strip())
+                    confidence = float(value)
                 except ValueError:
                     confidence = 0.5
-            elif line.startswith("REASON:"):
-                reason = line.replace("REASON:", "").strip()
+            else:
+                reason = value
 
         # Determine if we should block based on verdict and confidence
-        should_block = verdict == SafetyVerdict.UNSAFE and confidence >= 0.7
+        should_block = verdict is SafetyVerdict.UNSAFE and confidence >= 0.7
 
         return SafetyResult(
             verdict=verdict,
@@ -242,34 +273,29 @@ class GeminiSafetyJudge:
             should_block=should_block,
         )
 
-    async def screen_input_async(self, user_input: str) -> SafetyResult:
+    async def screen_input_async(self, user_input: str, force_llm: bool = False) -> SafetyResult:
         """
         Screen user input for safety issues (async).
 
         Args:
             user_input: The user's input text.
+            force_llm: Skip the pattern pre-screen and always ask the judge.
 
         Returns:
             SafetyResult with verdict and details.
         """
         if not self.enabled:
-            return SafetyResult(
-                verdict=SafetyVerdict.SAFE,
-                threat_category=ThreatCategory.NONE,
-                reason="Safety screening disabled",
-                confidence=1.0,
-                should_block=False,
-            )
+            return _SCREENING_DISABLED_RESULT
+
+        # Obvious threats are blocked by the pattern screen without an API call
+        if not force_llm:
+            quick_result = quick_screen_input(user_input)
+            if quick_result.should_block:
+                return quick_result
 
         client = self._get_client()
         if client is None:
-            return SafetyResult(
-                verdict=SafetyVerdict.UNKNOWN,
-                threat_category=ThreatCategory.NONE,
-                reason="Judge unavailable",
-                confidence=0.0,
-                should_block=False,
-            )
+            return _JUDGE_UNAVAILABLE_RESULT
 
         prompt = INPUT_SCREENING_PROMPT.format(content=user_input)
 
@@ -295,7 +321,7 @@ class GeminiSafetyJudge:
                 should_block=False,
             )
 
-    def screen_input(self, user_input: str) -> SafetyResult:
+    def screen_input(self, user_input: str, force_llm: bool = False) -> SafetyResult:
         """
         Screen user input for safety issues (sync wrapper).
 
@@ -304,28 +330,23 @@ class GeminiSafetyJudge:
 
         Args:
             user_input: The user's input text.
+            force_llm: Skip the pattern pre-screen and always ask the judge.
 
         Returns:
             SafetyResult with verdict and details.
         """
         if not self.enabled:
-            return SafetyResult(
-                verdict=SafetyVerdict.SAFE,
-                threat_category=ThreatCategory.NONE,
-                reason="Safety screening disabled",
-                confidence=1.0,
-                should_block=False,
-            )
+            return _SCREENING_DISABLED_RESULT
+
+        # Obvious threats are blocked by the pattern screen without an API call
+        if not force_llm:
+            quick_result = quick_screen_input(user_input)
+            if quick_result.should_block:
+                return quick_result
 
         client = self._get_client()
         if client is None:
-            return SafetyResult(
-                verdict=SafetyVerdict.UNKNOWN,
-                threat_category=ThreatCategory.NONE,
-                reason="Judge unavailable",
-                confidence=0.0,
-                should_block=False,
-            )
+            return _JUDGE_UNAVAILABLE_RESULT
 
         prompt = INPUT_SCREENING_PROMPT.format(content=user_input)
 
@@ -352,34 +373,29 @@ class GeminiSafetyJudge:
                 should_block=False,
             )
 
-    async def screen_output_async(self, agent_output: str) -> SafetyResult:
+    async def screen_output_async(self, agent_output: str, force_llm: bool = False) -> SafetyResult:
         """
         Screen agent output for safety issues (async).
 
         Args:
             agent_output: The agent's output text.
+            force_llm: Skip the pattern pre-screen and always ask the judge.
 
         Returns:
             SafetyResult with verdict and details.
         """
         if not self.enabled:
-            return SafetyResult(
-                verdict=SafetyVerdict.SAFE,
-                threat_category=ThreatCategory.NONE,
-                reason="Safety screening disabled",
-                confidence=1.0,
-                should_block=False,
-            )
+            return _SCREENING_DISABLED_RESULT
+
+        # Obvious threats are blocked by the pattern screen without an API call
+        if not force_llm:
+            quick_result = quick_screen_output(agent_output)
+            if quick_result.should_block:
+                return quick_result
 
         client = self._get_client()
         if client is None:
-            return SafetyResult(
-                verdict=SafetyVerdict.UNKNOWN,
-                threat_category=ThreatCategory.NONE,
-                reason="Judge unavailable",
-                confidence=0.0,
-                should_block=False,
-            )
+            return _JUDGE_UNAVAILABLE_RESULT
 
         prompt = OUTPUT_SCREENING_PROMPT.format(content=agent_output)
 
@@ -418,23 +434,11 @@ class GeminiSafetyJudge:
             SafetyResult with verdict and details.
         """
         if not self.enabled:
-            return SafetyResult(
-                verdict=SafetyVerdict.SAFE,
-                threat_category=ThreatCategory.NONE,
-                reason="Safety screening disabled",
-                confidence=1.0,
-                should_block=False,
-            )
+            return _SCREENING_DISABLED_RESULT
 
         client = self._get_client()
         if client is None:
-            return SafetyResult(
-                verdict=SafetyVerdict.UNKNOWN,
-                threat_category=ThreatCategory.NONE,
-                reason="Judge unavailable",
-                confidence=0.0,
-                should_block=False,
-            )
+            return _JUDGE_UNAVAILABLE_RESULT
 
         prompt = TOOL_SCREENING_PROMPT.format(
             tool_name=tool_name,
@@ -477,23 +481,11 @@ class GeminiSafetyJudge:
             SafetyResult with verdict and details.
         """
         if not self.enabled:
-            return SafetyResult(
-                verdict=SafetyVerdict.SAFE,
-                threat_category=ThreatCategory.NONE,
-                reason="Safety screening disabled",
-                confidence=1.0,
-                should_block=False,
-            )
+            return _SCREENING_DISABLED_RESULT
 
         client = self._get_client()
         if client is None:
-            return SafetyResult(
-                verdict=SafetyVerdict.UNKNOWN,
-                threat_category=ThreatCategory.NONE,
-                reason="Judge unavailable",
-                confidence=0.0,
-                should_block=False,
-            )
+            return _JUDGE_UNAVAILABLE_RESULT
 
         prompt = TOOL_SCREENING_PROMPT.format(
             tool_name=tool_name,
@@ -528,22 +520,11 @@ class GeminiSafetyJudge:
 # =============================================================================
 
 
-def quick_screen_input(text: str) -> SafetyResult:
-    """
-    Fast pattern-based input screening (no LLM call).
-
-    Use this for quick first-pass screening before LLM-based screening.
-
-    Args:
-        text: Text to screen.
-
-    Returns:
-        SafetyResult with verdict.
-    """
-    text_lower = text.lower()
-
-    # Check for obvious prompt injection patterns
-    injection_patterns = [
+# Patterns are compiled once at import. Input patterns run against lowercased
+# text; output (PII) patterns are case-insensitive.
+_INJECTION_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
         r"ignore\s+(previous|all|above)\s+instructions",
         r"disregard\s+(your|the)\s+(instructions|rules)",
         r"you\s+are\s+now\s+a",
@@ -555,46 +536,171 @@ def quick_screen_input(text: str) -> SafetyResult:
         r"jailbreak",
         r"do\s+anything\s+now",
         r"dan\s+mode",
-    ]
+    )
+)
 
-    for pattern in injection_patterns:
-        if re.search(pattern, text_lower):
-            return SafetyResult(
-                verdict=SafetyVerdict.UNSAFE,
-                threat_category=ThreatCategory.PROMPT_INJECTION,
-                reason=f"Detected injection pattern: {pattern}",
-                confidence=0.9,
-                should_block=True,
-            )
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
+class _GapPattern:
+    """
+    Linear-time matcher for a ``<word>\\s+.*<tail>`` pattern.
+
+    Run through ``re``, such a pattern backtracks over every split of the
+    whitespace and ``.*`` at every occurrence of the word, which goes cubic on
+    crafted input (a few KB of spaces after "curl" takes seconds). It matches
+    exactly when some occurrence of the word is followed by whitespace and the
+    tail starts no later than the end of the line that whitespace ends on, so
+    that is checked directly, sharing one tail search across occurrences.
+    """
 
-    # Check for data exfiltration patterns
-    exfil_patterns = [
-        r"send\s+(to|via)\s+(http|https|ftp|email)",
-        r"curl\s+.*\s+-d",
-        r"wget\s+.*--post-data",
+    __slots__ = ("pattern", "_head", "_tail")
+
+    def __init__(self, pattern: str, word: str, tail: str):
+        self.pattern = pattern  # The equivalent regex, reported in reasons
+        self._head = re.compile(rf"{word}(?=\s)")
+        self._tail = re.compile(tail)
+
+    def search(self, text: str) -> bool:
+        tail_start = -1
+        line_end = -1
+        for head in self._head.finditer(text):
+            gap_start = head.end() + 1
+            # \s+ may cross newlines; .* then runs to the end of that line
+            run_end = _WHITESPACE_RUN.match(text, head.end()).end()
+            if line_end < run_end:
+                line_end = text.find("\n", run_end)
+                if line_end == -1:
+                    line_end = len(text)
+            if tail_start < gap_start:
+                tail = self._tail.search(text, gap_start)
+                if tail is None:
+                    return False
+                tail_start = tail.start()
+            if tail_start <= line_end:
+                return True
+        return False
+
+
+_EXFIL_PATTERNS = (
+    re.compile(r"send\s+(to|via)\s+(http|https|ftp|email)"),
+    # Tail is \s+-d: tried only at whitespace-run starts, plus the last
+    # whitespace before "-d" for a run that began before the gap
+    _GapPattern(r"curl\s+.*\s+-d", "curl", r"(?<!\s)\s+-d|\s(?=-d)"),
+    _GapPattern(r"wget\s+.*--post-data", "wget", r"--post-data"),
+    _GapPattern(
         r"upload\s+.*(to|via)\s+(my|external|remote|their)",
-        r"upload\s+(to|via)",
-        r"exfiltrate",
+        "upload",
+        r"(to|via)\s+(my|external|remote|their)",
+    ),
+    re.compile(r"upload\s+(to|via)"),
+    re.compile(r"exfiltrate"),
+    _GapPattern(
         r"transfer\s+.*(to|via)\s+(external|remote)",
-    ]
+        "transfer",
+        r"(to|via)\s+(external|remote)",
+    ),
+)
 
-    for pattern in exfil_patterns:
-        if re.search(pattern, text_lower):
-            return SafetyResult(
-                verdict=SafetyVerdict.UNSAFE,
-                threat_category=ThreatCategory.DATA_EXFILTRATION,
-                reason=f"Detected exfiltration pattern: {pattern}",
-                confidence=0.85,
-                should_block=True,
-            )
+_PII_PATTERNS = tuple(
+    (re.compile(p, re.IGNORECASE), pii_type)
+    for p, pii_type in (
+        (r"\b\d{3}-\d{2}-\d{4}\b", "SSN"),
+        (r"\b\d{16}\b", "Credit card"),
+        (r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b", "Credit card"),
+        (r"password\s*[:=]\s*\S+", "Password"),
+        (r"api[_-]?key\s*[:=]\s*\S+", "API key"),
+        (r"secret\s*[:=]\s*\S+", "Secret"),
+        (r"token\s*[:=]\s*\S+", "Token"),
+        (r"-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----", "Private key"),
+        (r"aws_secret_access_key\s*=", "AWS secret"),
+    )
+)
 
-    return SafetyResult(
-        verdict=SafetyVerdict.SAFE,
-        threat_category=ThreatCategory.NONE,
-        reason="No obvious threats detected",
-        confidence=0.7,
-        should_block=False,
+# Each pattern list fused into one alternation, so benign text (the common
+# case) is scanned once rather than once per pattern. On a hit the individual
+# patterns are checked in order, keeping the first-listed pattern as the reason.
+_INPUT_THREAT_RE = re.compile(
+    "|".join(
+        f"(?:{p.pattern})"
+        for p in _INJECTION_PATTERNS + _EXFIL_PATTERNS
+        if isinstance(p, re.Pattern)
     )
+)
+_INPUT_GAP_PATTERNS = tuple(p for p in _EXFIL_PATTERNS if isinstance(p, _GapPattern))
+_OUTPUT_PII_RE = re.compile("|".join(f"(?:{p.pattern})" for p, _ in _PII_PATTERNS), re.IGNORECASE)
+
+# Literals at least one of which every input pattern requires; checked with
+# plain substring search before any regex runs. Input patterns match lowercased
+# text without IGNORECASE, so lowercase literals are exact.
+_INPUT_ANCHORS = (
+    "ignore",
+    "disregard",
+    "now",
+    "pretend",
+    "act",
+    "roleplay",
+    "override",
+    "bypass",
+    "jailbreak",
+    "anything",
+    "dan",
+    "send",
+    "curl",
+    "wget",
+    "upload",
+    "exfiltrate",
+    "transfer",
+)
+
+# Keyword anchors for the PII patterns, compared against casefolded text. They
+# avoid "i" because IGNORECASE also matches dotless i, which casefold keeps.
+# The numeric patterns (SSN, card numbers) all need a run of three digits.
+_PII_ANCHORS = ("password", "key", "secret", "token")
+_PII_DIGITS_RE = re.compile(r"\d{3}")
+
+
+def quick_screen_input(text: str) -> SafetyResult:
+    """
+    Fast pattern-based input screening (no LLM call).
+
+    Use this for quick first-pass screening before LLM-based screening.
+
+    Args:
+        text: Text to screen.
+
+    Returns:
+        SafetyResult with verdict.
+    """
+    text_lower = text.lower()
+    has_anchor = any(anchor in text_lower for anchor in _INPUT_ANCHORS)
+    if has_anchor and (
+        _INPUT_THREAT_RE.search(text_lower)
+        or any(pattern.search(text_lower) for pattern in _INPUT_GAP_PATTERNS)
+    ):
+        # Check for obvious prompt injection patterns
+        for pattern in _INJECTION_PATTERNS:
+            if pattern.search(text_lower):
+                return SafetyResult(
+                    verdict=SafetyVerdict.UNSAFE,
+                    threat_category=ThreatCategory.PROMPT_INJECTION,
+                    reason=f"Detected injection pattern: {pattern.pattern}",
+                    confidence=0.9,
+                    should_block=True,
+                )
+
+        # Check for data exfiltration patterns
+        for pattern in _EXFIL_PATTERNS:
+            if pattern.search(text_lower):
+                return SafetyResult(
+                    verdict=SafetyVerdict.UNSAFE,
+                    threat_category=ThreatCategory.DATA_EXFILTRATION,
+                    reason=f"Detected exfiltration pattern: {pattern.pattern}",
+                    confidence=0.85,
+                    should_block=True,
+                )
+
+    return _SAFE_INPUT_RESULT
 
 
 def quick_screen_output(text: str) -> SafetyResult:
@@ -608,35 +714,67 @@ def quick_screen_output(text: str) -> SafetyResult:
         SafetyResult with verdict.
     """
     # Check for PII patterns
-    pii_patterns = [
-        (r"\b\d{3}-\d{2}-\d{4}\b", "SSN"),
-        (r"\b\d{16}\b", "Credit card"),
-        (r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b", "Credit card"),
-        (r"password\s*[:=]\s*\S+", "Password"),
-        (r"api[_-]?key\s*[:=]\s*\S+", "API key"),
-        (r"secret\s*[:=]\s*\S+", "Secret"),
-        (r"token\s*[:=]\s*\S+", "Token"),
-        (r"-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----", "Private key"),
-        (r"aws_secret_access_key\s*=", "AWS secret"),
-    ]
+    folded = text.casefold()
+    has_anchor = any(anchor in folded for anchor in _PII_ANCHORS) or _PII_DIGITS_RE.search(text)
+    if has_anchor and _OUTPUT_PII_RE.search(text):
+        for pattern, pii_type in _PII_PATTERNS:
+            if pattern.search(text):
+                return SafetyResult(
+                    verdict=SafetyVerdict.UNSAFE,
+                    threat_category=ThreatCategory.PII_EXPOSURE,
+                    reason=f"Detected potential {pii_type} in output",
+                    confidence=0.85,
+                    should_block=True,
+                )
+
+    return _SAFE_OUTPUT_RESULT
+
+
+# Joins batched texts. No pattern can match across it: "." and "\S" stop at
+# the newline, and "\s" stops at the NULs.
+_BATCH_SEPARATOR = "\x00\n\x00"
+
+# A superset of the input patterns that is safe to run over joined text: gap
+# patterns contribute only their leading word, and hits are re-screened exactly
+_INPUT_CANDIDATE_RE = re.compile(
+    "|".join(
+        f"(?:{p._head.pattern if isinstance(p, _GapPattern) else p.pattern})"
+        for p in _INJECTION_PATTERNS + _EXFIL_PATTERNS
+    )
+)
 
-    for pattern, pii_type in pii_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return SafetyResult(
-                verdict=SafetyVerdict.UNSAFE,
-                threat_category=ThreatCategory.PII_EXPOSURE,
-                reason=f"Detected potential {pii_type} in output",
-                confidence=0.85,
-                should_block=True,
-            )
 
-    return SafetyResult(
-        verdict=SafetyVerdict.SAFE,
-        threat_category=ThreatCategory.NONE,
-        reason="No PII detected",
-        confidence=0.8,
-        should_block=False,
-    )
+def quick_screen_batch(texts: list[str]) -> list[SafetyResult]:
+    """
+    Pattern-screen several inputs with one regex scan.
+
+    The texts are joined and scanned once for candidate threats; only texts
+    with a candidate are screened individually, so each result is the same as
+    quick_screen_input() would return for that text.
+
+    Args:
+        texts: Texts to screen.
+
+    Returns:
+        One SafetyResult per text, in order.
+    """
+    results = [_SAFE_INPUT_RESULT] * len(texts)
+    lowered = [text.lower() for text in texts]
+    offsets = []
+    end = 0
+    for text_lower in lowered:
+        offsets.append(end)
+        end += len(text_lower) + len(_BATCH_SEPARATOR)
+    joined = _BATCH_SEPARATOR.join(lowered)
+
+    pos = 0
+    while match := _INPUT_CANDIDATE_RE.search(joined, pos):
+        index = bisect_right(offsets, match.start()) - 1
+        results[index] = quick_screen_input(texts[index])
+        if index + 1 == len(texts):
+            break
+        pos = offsets[index + 1]
+    return results
 
 
 # =============================================================================
@@ -721,7 +859,8 @@ def create_safety_screening_callback():
         # LLM-based screening for production (slower but more comprehensive)
         if settings.ENVIRONMENT == "production":
             judge = get_safety_judge()
-            result = judge.screen_input(user_text)
+            # Already pattern-screened above; go straight to the judge
+            result = judge.screen_input(user_text, force_llm=True)
             if result.should_block:
                 logger.warning(f"Input blocked by LLM judge: {result.threat_category.value}")
                 callback_context.state["safety_blocked"] = True
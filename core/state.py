@@ -44,6 +44,7 @@ Example usage:
 """
 
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -217,6 +218,33 @@ class StateManager:
         """Get all state as a dictionary."""
         return dict(self._state)
 
+    def get_state_by_scope(self) -> dict[str, dict[str, Any]]:
+        """
+        Split all state into its scopes in a single pass.
+
+        For callers that need more than one scope; each get_*_state() method
+        walks the whole state on its own.
+
+        Returns:
+            Dict mapping "" (session), "user:", "app:" and "temp:" to that
+            scope's state, with the prefix stripped from each key.
+        """
+        buckets: dict[str, dict[str, Any]] = {
+            "": {},
+            StatePrefix.USER: {},
+            StatePrefix.APP: {},
+            StatePrefix.TEMP: {},
+        }
+        session = buckets[""]
+        for k, v in self._state.items():
+            prefix, sep, rest = k.partition(":")
+            bucket = buckets.get(prefix + sep) if sep else None
+            if bucket is None:
+                session[k] = v
+            else:
+                bucket[rest] = v
+        return buckets
+
     def get_session_state(self) -> dict[str, Any]:
         """Get only session-level state (no prefix)."""
         return {
@@ -246,7 +274,7 @@ class StateManager:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestigationContext:
     """
     Structured context for tracking an investigation across tool calls.
@@ -314,19 +342,22 @@ def initialize_session_state(state: dict[str, Any]) -> None:
     Args:
         state: The session state dictionary.
     """
-    import time
+    # Already initialized on every call after the first
+    if StateKeys.INVESTIGATION_CONTEXT in state and StateKeys.SESSION_START in state:
+        return
 
     manager = StateManager(state)
+    now = time.time()
 
     # Initialize investigation context if not present
     if not manager.has(StateKeys.INVESTIGATION_CONTEXT):
-        context = InvestigationContext(start_time=time.time())
+        context = InvestigationContext(start_time=now)
         manager.set(StateKeys.INVESTIGATION_CONTEXT, context.to_dict())
         logger.debug("Initialized investigation context")
 
     # Initialize session start time
     if not manager.has(StateKeys.SESSION_START):
-        manager.set(StateKeys.SESSION_START, time.time())
+        manager.set(StateKeys.SESSION_START, now)
         logger.debug("Initialized session start time")
 
 
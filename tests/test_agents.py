@@ -281,91 +281,85 @@ async def test_sysadmin_agent_responds():
 
 
 # =============================================================================
-# Test Session State Management
+# Shared Session Fixtures
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_session_state_initialized():
-    """Session state should be initialized by before_agent_callback."""
-    try:
-        from google.adk.sessions import InMemorySessionService
+class MockCallbackContext:
+    """Minimal callback context backed by a real session's state."""
 
-        from core.callbacks import before_agent_callback
+    def __init__(self, state, invocation_id: str = "TEST123"):
+        self.state = state
+        self.agent_name = "test_agent"
+        self.invocation_id = invocation_id
 
-        session_service = InMemorySessionService()
 
-        session = session_service.create_session_sync(
-            app_name="sysadmin-agents",
-            user_id="test_user",
-        )
+class MockToolContext:
+    """Minimal tool context sharing state with a callback context."""
 
-        # Create a mock callback context
-        class MockCallbackContext:
-            def __init__(self, state):
-                self.state = state
-                self.agent_name = "test_agent"
-                self.invocation_id = "TEST123"
+    def __init__(self, state):
+        self.state = state
+        self.agent_name = "test_agent"
 
-        mock_context = MockCallbackContext(session.state)
 
-        # Run before_agent_callback
-        before_agent_callback(mock_context)
+@pytest.fixture(scope="session")
+def session_service():
+    """One InMemorySessionService shared by all callback-path tests."""
+    sessions = pytest.importorskip("google.adk.sessions")
+    return sessions.InMemorySessionService()
 
-        # Check state was initialized
-        assert "investigation_context" in mock_context.state
-        assert "session_start" in mock_context.state
 
-    except ImportError as e:
-        pytest.skip(f"ADK not available: {e}")
-    except Exception as e:
-        pytest.skip(f"Error during test: {e}")
+@pytest.fixture
+def invoc_context(session_service):
+    """Fresh session per test, wrapped in a callback context."""
+    session = session_service.create_session_sync(
+        app_name="sysadmin-agents",
+        user_id="test_user",
+    )
+    return MockCallbackContext(session.state, invocation_id=f"T{id(session)}")
+
+
+@pytest.fixture
+def initialized_context(invoc_context):
+    """Callback context after before_agent_callback has set up state."""
+    from core.callbacks import before_agent_callback
+
+    before_agent_callback(invoc_context)
+    return invoc_context
 
 
 # =============================================================================
-# Test Tool Context
+# Test Session State Management
 # =============================================================================
 
 
 @pytest.mark.asyncio
-async def test_tool_callback_tracks_hosts():
-    """Tool callback should track hosts accessed in investigation context."""
-    try:
-        from core.callbacks import before_agent_callback, before_tool_callback
-
-        # Create mock state
-        mock_state = {}
+async def test_session_state_initialized(initialized_context):
+    """Session state should be initialized by before_agent_callback."""
+    assert "investigation_context" in initialized_context.state
+    assert "session_start" in initialized_context.state
 
-        class MockCallbackContext:
-            def __init__(self, state):
-                self.state = state
-                self.agent_name = "test_agent"
-                self.invocation_id = "TEST456"
 
-        class MockToolContext:
-            def __init__(self, state):
-                self.state = state
-                self.agent_name = "test_agent"
+# =============================================================================
+# Test Tool Context
+# =============================================================================
 
-        class MockTool:
-            name = "get_disk_usage"
 
-        # Initialize state
-        callback_context = MockCallbackContext(mock_state)
-        before_agent_callback(callback_context)
+@pytest.mark.asyncio
+async def test_tool_callback_tracks_hosts(initialized_context):
+    """Tool callback should track hosts accessed in investigation context."""
+    from core.callbacks import before_tool_callback
 
-        # Create tool context
-        tool_context = MockToolContext(mock_state)
+    class MockTool:
+        name = "get_disk_usage"
 
-        # Simulate tool call
-        result = before_tool_callback(MockTool(), {"host": "server1"}, tool_context)
+    # Create tool context sharing the same session state
+    tool_context = MockToolContext(initialized_context.state)
 
-        # Should proceed
-        assert result is None
-        # Host should be tracked
-        assert "server1" in tool_context.state["investigation_context"]["hosts_accessed"]
+    # Simulate tool call
+    result = before_tool_callback(MockTool(), {"host": "server1"}, tool_context)
 
-    except ImportError as e:
-        pytest.skip(f"ADK not available: {e}")
-    except Exception as e:
-        pytest.skip(f"Error during test: {e}")
+    # Should proceed
+    assert result is None
+    # Host should be tracked
+    assert "server1" in tool_context.state["investigation_context"]["hosts_accessed"]
@@ -14,10 +14,10 @@
 
 """Tests for the artifacts management module."""
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
-from unittest.mock import AsyncMock
 
 import pytest
 
@@ -137,23 +137,20 @@ class MockContext:
     """Mock context for testing ArtifactHelper."""
 
     def __init__(self):
-        self._artifacts: dict[str, list[MockPart]] = {}
-        self.save_artifact = AsyncMock(side_effect=self._save_artifact)
-        self.load_artifact = AsyncMock(side_effect=self._load_artifact)
-        self.list_artifacts = AsyncMock(side_effect=self._list_artifacts)
+        self._artifacts: defaultdict[str, list[MockPart]] = defaultdict(list)
+        self.load_calls: list[dict[str, Any]] = []
 
-    async def _save_artifact(self, filename: str, artifact: Any) -> int:
+    async def save_artifact(self, filename: str, artifact: Any) -> int:
         """Mock save_artifact implementation."""
-        if filename not in self._artifacts:
-            self._artifacts[filename] = []
-        self._artifacts[filename].append(artifact)
-        return len(self._artifacts[filename]) - 1
+        versions = self._artifacts[filename]
+        versions.append(artifact)
+        return len(versions) - 1
 
-    async def _load_artifact(self, filename: str, version: int | None = None) -> Any:
+    async def load_artifact(self, filename: str, version: int | None = None) -> Any:
         """Mock load_artifact implementation."""
-        if filename not in self._artifacts:
-            return None
-        versions = self._artifacts[filename]
+        self.load_calls.append({"filename": filename, "version": version})
+        # .get() so a lookup miss doesn't insert an empty entry
+        versions = self._artifacts.get(filename)
         if not versions:
             return None
         if version is None:
@@ -162,7 +159,7 @@ class MockContext:
             return versions[version]
         return None
 
-    async def _list_artifacts(self) -> list[str]:
+    async def list_artifacts(self) -> list[str]:
         """Mock list_artifacts implementation."""
         return list(self._artifacts.keys())
 
@@ -172,19 +169,31 @@ class MockContext:
 # =============================================================================
 
 
-class TestArtifactHelper:
-    """Tests for ArtifactHelper class."""
+class _ArtifactHelperBase:
+    """Shares one mock context per test class, reset before each test."""
 
-    @pytest.fixture
-    def mock_context(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_context(cls):
         """Create a mock context for testing."""
         return MockContext()
 
-    @pytest.fixture
-    def helper(self, mock_context):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def helper(cls, mock_context):
         """Create an ArtifactHelper with mock context."""
         return ArtifactHelper(mock_context)
 
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_context):
+        """Clear stored artifacts and call records between tests."""
+        mock_context._artifacts.clear()
+        mock_context.load_calls.clear()
+
+
+class TestArtifactHelper(_ArtifactHelperBase):
+    """Tests for ArtifactHelper class."""
+
     def test_is_available(self, helper):
         """Should check if artifact service is available."""
         assert helper.is_available() is True
@@ -200,27 +209,23 @@ class TestArtifactHelper:
 
 
 @pytest.mark.asyncio
-class TestArtifactHelperTextOperations:
-    """Tests for ArtifactHelper text operations."""
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context for testing."""
-        return MockContext()
-
-    @pytest.fixture
-    def helper(self, mock_context):
-        """Create an ArtifactHelper with mock context."""
-        return ArtifactHelper(mock_context)
-
-    async def test_save_text(self, helper, mock_context):
-        """Should save text content."""
-        version = await helper.save_text("test.txt", "Hello, World!")
+class TestArtifactHelperSaveLoadOperations(_ArtifactHelperBase):
+    """Tests for ArtifactHelper text, JSON and binary save/load operations."""
+
+    @pytest.mark.parametrize(
+        "method,fname,args",
+        [
+            ("save_text", "test.txt", ("Hello, World!",)),
+            ("save_json", "data.json", ({"status": "ok", "count": 42},)),
+            ("save_binary", "image.png", (b"\x89PNG\r\n\x1a\n...", MimeType.PNG)),
+        ],
+    )
+    async def test_save(self, helper, mock_context, method, fname, args):
+        """Should save content under the given filename."""
+        version = await getattr(helper, method)(fname, *args)
 
         assert version == 0
-        mock_context.save_artifact.assert_called_once()
-        call_args = mock_context.save_artifact.call_args
-        assert call_args.kwargs["filename"] == "test.txt"
+        assert len(mock_context._artifacts[fname]) == 1
 
     async def test_load_text(self, helper, mock_context):
         """Should load text content."""
@@ -231,88 +236,25 @@ class TestArtifactHelperTextOperations:
         _ = await helper.load_text("test.txt")
         # Note: Due to mock implementation, we get a types.Part back
         # In real implementation, this would return the text content
-        mock_context.load_artifact.assert_called()
-
-    async def test_load_text_not_found(self, helper):
-        """Should return None for non-existent artifact."""
-        content = await helper.load_text("nonexistent.txt")
-        assert content is None
-
-
-@pytest.mark.asyncio
-class TestArtifactHelperJsonOperations:
-    """Tests for ArtifactHelper JSON operations."""
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context for testing."""
-        return MockContext()
-
-    @pytest.fixture
-    def helper(self, mock_context):
-        """Create an ArtifactHelper with mock context."""
-        return ArtifactHelper(mock_context)
-
-    async def test_save_json(self, helper, mock_context):
-        """Should save JSON data."""
-        data = {"status": "ok", "count": 42}
-        version = await helper.save_json("data.json", data)
-
-        assert version == 0
-        mock_context.save_artifact.assert_called_once()
-        call_args = mock_context.save_artifact.call_args
-        assert call_args.kwargs["filename"] == "data.json"
-
-    async def test_load_json_not_found(self, helper):
+        assert mock_context.load_calls[-1]["filename"] == "test.txt"
+
+    @pytest.mark.parametrize(
+        "method,fname",
+        [
+            ("load_text", "nonexistent.txt"),
+            ("load_json", "nonexistent.json"),
+            ("load_binary", "nonexistent.png"),
+        ],
+    )
+    async def test_load_not_found(self, helper, method, fname):
         """Should return None for non-existent artifact."""
-        data = await helper.load_json("nonexistent.json")
-        assert data is None
+        assert await getattr(helper, method)(fname) is None
 
 
 @pytest.mark.asyncio
-class TestArtifactHelperBinaryOperations:
-    """Tests for ArtifactHelper binary operations."""
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context for testing."""
-        return MockContext()
-
-    @pytest.fixture
-    def helper(self, mock_context):
-        """Create an ArtifactHelper with mock context."""
-        return ArtifactHelper(mock_context)
-
-    async def test_save_binary(self, helper, mock_context):
-        """Should save binary data."""
-        data = b"\x89PNG\r\n\x1a\n..."
-        version = await helper.save_binary("image.png", data, MimeType.PNG)
-
-        assert version == 0
-        mock_context.save_artifact.assert_called_once()
-        call_args = mock_context.save_artifact.call_args
-        assert call_args.kwargs["filename"] == "image.png"
-
-    async def test_load_binary_not_found(self, helper):
-        """Should return None for non-existent artifact."""
-        result = await helper.load_binary("nonexistent.png")
-        assert result is None
-
-
-@pytest.mark.asyncio
-class TestArtifactHelperListOperations:
+class TestArtifactHelperListOperations(_ArtifactHelperBase):
     """Tests for ArtifactHelper listing operations."""
 
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context for testing."""
-        return MockContext()
-
-    @pytest.fixture
-    def helper(self, mock_context):
-        """Create an ArtifactHelper with mock context."""
-        return ArtifactHelper(mock_context)
-
     async def test_list_all(self, helper, mock_context):
         """Should list all artifacts."""
         # Save some artifacts
@@ -341,6 +283,15 @@ class TestArtifactHelperListOperations:
         assert "user:user.txt" in artifacts
         assert "session.txt" not in artifacts
 
+    async def test_list_by_scope(self, helper, mock_context):
+        """Should split artifacts into session and user scopes in one listing."""
+        await helper.save_text("session.txt", "content")
+        await helper.save_text("user:user.txt", "content")
+
+        session_artifacts, user_artifacts = await helper.list_by_scope()
+        assert session_artifacts == ["session.txt"]
+        assert user_artifacts == ["user:user.txt"]
+
     async def test_exists(self, helper, mock_context):
         """Should check if artifact exists."""
         await helper.save_text("exists.txt", "content")
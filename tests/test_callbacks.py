@@ -19,12 +19,57 @@ Tests callbacks using real function calls with minimal state objects,
 following the pattern used in Google ADK samples.
 """
 
+import itertools
 import logging
 import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from core import callbacks
+from core.callbacks import (
+    after_tool_callback,
+    before_agent_callback,
+    before_tool_callback,
+    create_before_model_callback,
+    create_callbacks_for_agent,
+    get_rate_limit_secs,
+    get_rpm_quota,
+    input_validation_callback,
+    rate_limit_callback,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fake clock origin; tests seed timestamps with this instead of time.time()
+_CLOCK_START = 1000.0
+
+
+class _FakeTime:
+    """Stand-in for the time module as seen by core.callbacks.
+
+    time() ticks one second per call from _CLOCK_START; every other attribute
+    comes from the real time module.
+    """
+
+    __slots__ = ("_ticks",)
+
+    def __init__(self) -> None:
+        self._ticks = itertools.count(_CLOCK_START, 1.0)
+
+    def time(self) -> float:
+        return next(self._ticks)
+
+    def __getattr__(self, name: str):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Give core.callbacks a deterministic clock without touching time.time() elsewhere."""
+    monkeypatch.setattr(callbacks, "time", _FakeTime())
+
 
 # =============================================================================
 # Simple state container for testing (mimics ADK context.state)
@@ -34,42 +79,50 @@ logger = logging.getLogger(__name__)
 class SimpleState(dict):
     """Dict-like state container for testing callbacks."""
 
-    pass
+    __slots__ = ()
 
 
+@dataclass(slots=True)
 class SimpleContext:
     """Simple context object for testing callbacks."""
 
-    def __init__(self, state: dict | None = None):
-        self.state = SimpleState(state or {})
+    state: SimpleState = field(default_factory=SimpleState)
 
+    def __post_init__(self):
+        self.state = SimpleState(self.state)
 
+
+@dataclass(slots=True)
 class SimpleTool:
     """Simple tool object for testing callbacks."""
 
-    def __init__(self, name: str):
-        self.name = name
+    name: str
 
 
+@dataclass(slots=True)
 class SimpleLlmRequest:
     """Simple LLM request object for testing callbacks."""
 
-    def __init__(self, contents: list | None = None):
-        self.contents = contents or []
+    contents: list = field(default_factory=list)
 
 
+@dataclass(slots=True)
 class SimplePart:
     """Simple part object for testing callbacks."""
 
-    def __init__(self, text: str = ""):
-        self.text = text
+    text: str = ""
 
 
+@dataclass(slots=True)
 class SimpleContent:
     """Simple content object for testing callbacks."""
 
-    def __init__(self, parts: list | None = None):
-        self.parts = parts or []
+    parts: list = field(default_factory=list)
+
+
+def _req(*texts: str) -> SimpleLlmRequest:
+    """Build a request with one single-part content per text."""
+    return SimpleLlmRequest(contents=[SimpleContent(parts=[SimplePart(text=t)]) for t in texts])
 
 
 # =============================================================================
@@ -77,26 +130,22 @@ class SimpleContent:
 # =============================================================================
 
 
-def test_rate_limit_initializes_state_on_first_call():
+def test_rate_limit_initializes_state_on_first_call(fake_clock):
     """Should initialize timer and counter on first call."""
-    from core.callbacks import rate_limit_callback
-
     context = SimpleContext()
     request = SimpleLlmRequest()
 
     rate_limit_callback(context, request)
 
-    assert "timer_start" in context.state
+    assert context.state["timer_start"] == _CLOCK_START
     assert context.state["request_count"] == 1
 
 
 def test_rate_limit_increments_counter():
     """Should increment request counter on each call."""
-    from core.callbacks import rate_limit_callback
-
     context = SimpleContext(
         {
-            "timer_start": time.time(),
+            "timer_start": _CLOCK_START,
             "request_count": 5,
         }
     )
@@ -107,94 +156,116 @@ def test_rate_limit_increments_counter():
     assert context.state["request_count"] == 6
 
 
-def test_rate_limit_fixes_empty_text_parts():
-    """Should fix empty text parts that can cause API errors."""
-    from core.callbacks import rate_limit_callback
+def test_rate_limit_blocks_within_window(fake_clock):
+    """Should flag the session when the quota is exceeded inside the window."""
+    context = SimpleContext({"timer_start": _CLOCK_START, "request_count": get_rpm_quota()})
 
-    part = SimplePart(text="")
-    content = SimpleContent(parts=[part])
-    request = SimpleLlmRequest(contents=[content])
-    context = SimpleContext()
+    rate_limit_callback(context, SimpleLlmRequest())
 
-    rate_limit_callback(context, request)
+    assert context.state["rate_limited"] is True
+    assert context.state["rate_limit_reset"] == _CLOCK_START + get_rate_limit_secs()
 
-    assert part.text == " "
 
+def test_rate_limit_resets_after_window(fake_clock):
+    """Should start a new window once the previous one has expired."""
+    context = SimpleContext(
+        {
+            "timer_start": _CLOCK_START - get_rate_limit_secs(),
+            "request_count": get_rpm_quota(),
+        }
+    )
 
-# =============================================================================
-# Test Input Validation - Direct function testing
-# =============================================================================
+    rate_limit_callback(context, SimpleLlmRequest())
 
+    assert context.state["timer_start"] == _CLOCK_START
+    assert context.state["request_count"] == 1
+    assert context.state["rate_limited"] is False
 
-def test_input_validation_detects_dangerous_rm_rf():
-    """Should detect rm -rf / pattern."""
-    from core.callbacks import input_validation_callback
 
-    part = SimplePart(text="Please run rm -rf / on the server")
-    content = SimpleContent(parts=[part])
-    request = SimpleLlmRequest(contents=[content])
+def test_rate_limit_fixes_empty_text_parts():
+    """Should fix empty text parts that can cause API errors."""
+    request = _req("")
     context = SimpleContext()
 
-    input_validation_callback(context, request)
+    rate_limit_callback(context, request)
+
+    assert request.contents[0].parts[0].text == " "
 
-    assert "security_warning" in context.state
-    assert "Blocked" in context.state["security_warning"]
 
+# =============================================================================
+# Test Input Validation - Direct function testing
+# =============================================================================
 
-def test_input_validation_detects_mkfs():
-    """Should detect mkfs pattern."""
-    from core.callbacks import input_validation_callback
 
-    part = SimplePart(text="Run mkfs.ext4 /dev/sda1")
-    content = SimpleContent(parts=[part])
-    request = SimpleLlmRequest(contents=[content])
+# input_validation_callback only reads the request, so these are built once
+# and shared; tests for callbacks that edit parts (rate limiting) use _req().
+_VALIDATION_REQUESTS = {
+    "rm_rf": _req("Please run rm -rf / on the server"),
+    "mkfs": _req("Run mkfs.ext4 /dev/sda1"),
+    "systemctl_stop": _req("Run systemctl stop nginx"),
+    "safe": _req("Check disk usage on server1"),
+    "empty": _req(),
+}
+
+
+@pytest.mark.parametrize(
+    "case,expected_warning",
+    [
+        ("rm_rf", "Blocked"),
+        ("mkfs", "Blocked"),
+        ("systemctl_stop", "Sensitive"),
+        ("safe", None),
+        ("empty", None),
+    ],
+)
+def test_input_validation(case, expected_warning):
+    """Should flag blocked and sensitive patterns and leave safe requests alone."""
     context = SimpleContext()
 
-    input_validation_callback(context, request)
-
-    assert "security_warning" in context.state
+    input_validation_callback(context, _VALIDATION_REQUESTS[case])
 
+    if expected_warning is None:
+        assert "security_warning" not in context.state
+    else:
+        assert context.state["security_warning"].startswith(expected_warning)
 
-def test_input_validation_detects_systemctl_stop():
-    """Should detect systemctl stop pattern."""
-    from core.callbacks import input_validation_callback
 
-    part = SimplePart(text="Run systemctl stop nginx")
-    content = SimpleContent(parts=[part])
-    request = SimpleLlmRequest(contents=[content])
+def test_input_validation_reports_first_configured_pattern():
+    """Should report the first configured pattern when several match."""
     context = SimpleContext()
 
-    input_validation_callback(context, request)
-
-    assert "security_warning" in context.state
-    assert "Sensitive" in context.state["security_warning"]
+    input_validation_callback(context, _req("reboot after you rm -rf / the box"))
 
+    assert context.state["security_warning"] == r"Blocked pattern detected: \brm\s+-rf\s+/"
 
-def test_input_validation_allows_safe_requests():
-    """Should not flag safe requests."""
-    from core.callbacks import input_validation_callback
 
-    part = SimplePart(text="Check disk usage on server1")
-    content = SimpleContent(parts=[part])
-    request = SimpleLlmRequest(contents=[content])
+@pytest.mark.parametrize(
+    "pattern,text",
+    [
+        ("(?i)drop table", "Please DROP TABLE users"),
+        (r"(\w+) \1", "run it it now"),
+    ],
+)
+def test_input_validation_handles_unfusable_patterns(monkeypatch, pattern, text):
+    """Patterns with inline flags or backreferences should still match."""
+    config = {"security": {"blocked_patterns": [{"pattern": pattern}, {"pattern": "rm -rf"}]}}
+    monkeypatch.setattr(callbacks, "_get_config", lambda: config)
     context = SimpleContext()
 
-    input_validation_callback(context, request)
+    input_validation_callback(context, _req(text))
 
-    assert "security_warning" not in context.state
+    assert context.state["security_warning"] == f"Blocked pattern detected: {pattern}"
 
 
-def test_input_validation_handles_empty_request():
-    """Should handle request with no contents."""
-    from core.callbacks import input_validation_callback
-
-    request = SimpleLlmRequest(contents=[])
+def test_input_validation_skips_invalid_pattern(monkeypatch):
+    """An invalid configured pattern should be skipped, not fail the request."""
+    config = {"security": {"blocked_patterns": [{"pattern": "[unclosed"}, {"pattern": "rm -rf"}]}}
+    monkeypatch.setattr(callbacks, "_get_config", lambda: config)
     context = SimpleContext()
 
-    # Should not raise
-    input_validation_callback(context, request)
+    input_validation_callback(context, _req("rm -rf /tmp/x"))
 
-    assert "security_warning" not in context.state
+    assert context.state["security_warning"] == "Blocked pattern detected: rm -rf"
 
 
 # =============================================================================
@@ -204,8 +275,6 @@ def test_input_validation_handles_empty_request():
 
 def test_before_agent_initializes_investigation_context():
     """Should initialize investigation context on new session."""
-    from core.callbacks import before_agent_callback
-
     context = SimpleContext()
 
     before_agent_callback(context)
@@ -221,8 +290,6 @@ def test_before_agent_initializes_investigation_context():
 
 def test_before_agent_initializes_session_start():
     """Should track session start time."""
-    from core.callbacks import before_agent_callback
-
     context = SimpleContext()
 
     before_agent_callback(context)
@@ -233,8 +300,6 @@ def test_before_agent_initializes_session_start():
 
 def test_before_agent_preserves_existing_context():
     """Should not overwrite existing investigation context."""
-    from core.callbacks import before_agent_callback
-
     existing_context = {
         "hosts_accessed": ["server1", "server2"],
         "tools_used": [{"tool": "get_disk_usage", "time": 12345.0}],
@@ -251,8 +316,6 @@ def test_before_agent_preserves_existing_context():
 
 def test_before_agent_initializes_allowed_hosts():
     """Should initialize allowed_hosts if not present."""
-    from core.callbacks import before_agent_callback
-
     context = SimpleContext()
 
     before_agent_callback(context)
@@ -268,15 +331,13 @@ def test_before_agent_initializes_allowed_hosts():
 
 def test_before_tool_tracks_tool_usage():
     """Should track tool calls in investigation context."""
-    from core.callbacks import before_tool_callback
-
     tool = SimpleTool(name="get_disk_usage")
     context = SimpleContext(
         {
             "investigation_context": {
                 "hosts_accessed": [],
                 "tools_used": [],
-                "start_time": time.time(),
+                "start_time": _CLOCK_START,
             }
         }
     )
@@ -290,15 +351,13 @@ def test_before_tool_tracks_tool_usage():
 
 def test_before_tool_tracks_host_access():
     """Should track host access for host-aware tools."""
-    from core.callbacks import before_tool_callback
-
     tool = SimpleTool(name="get_system_information")
     context = SimpleContext(
         {
             "investigation_context": {
                 "hosts_accessed": [],
                 "tools_used": [],
-                "start_time": time.time(),
+                "start_time": _CLOCK_START,
             }
         }
     )
@@ -311,15 +370,13 @@ def test_before_tool_tracks_host_access():
 
 def test_before_tool_does_not_duplicate_hosts():
     """Should not duplicate hosts in accessed list."""
-    from core.callbacks import before_tool_callback
-
     tool = SimpleTool(name="get_cpu_information")
     context = SimpleContext(
         {
             "investigation_context": {
                 "hosts_accessed": ["server1"],
                 "tools_used": [],
-                "start_time": time.time(),
+                "start_time": _CLOCK_START,
             }
         }
     )
@@ -327,20 +384,20 @@ def test_before_tool_does_not_duplicate_hosts():
     before_tool_callback(tool, {"host": "server1"}, context)
     before_tool_callback(tool, {"host": "server1"}, context)
 
-    assert context.state["investigation_context"]["hosts_accessed"].count("server1") == 1
+    hosts = context.state["investigation_context"]["hosts_accessed"]
+    assert len(hosts) == 1
+    assert set(hosts) == {"server1"}
 
 
 def test_before_tool_tracks_multiple_hosts():
     """Should track multiple different hosts."""
-    from core.callbacks import before_tool_callback
-
     tool = SimpleTool(name="get_memory_information")
     context = SimpleContext(
         {
             "investigation_context": {
                 "hosts_accessed": [],
                 "tools_used": [],
-                "start_time": time.time(),
+                "start_time": _CLOCK_START,
             }
         }
     )
@@ -351,22 +408,42 @@ def test_before_tool_tracks_multiple_hosts():
 
     hosts = context.state["investigation_context"]["hosts_accessed"]
     assert len(hosts) == 3
-    assert "server1" in hosts
-    assert "server2" in hosts
-    assert "server3" in hosts
+    assert set(hosts) == {"server1", "server2", "server3"}
+
+
+def test_before_tool_tracks_host_after_context_replaced():
+    """Should check hosts against the current investigation context."""
+    tool = SimpleTool(name="get_cpu_information")
+    context = SimpleContext(
+        {
+            "investigation_context": {
+                "hosts_accessed": [],
+                "tools_used": [],
+                "start_time": _CLOCK_START,
+            }
+        }
+    )
+
+    before_tool_callback(tool, {"host": "server1"}, context)
+    context.state["investigation_context"] = {
+        "hosts_accessed": ["server2"],
+        "tools_used": [],
+        "start_time": _CLOCK_START,
+    }
+    before_tool_callback(tool, {"host": "server1"}, context)
+
+    assert context.state["investigation_context"]["hosts_accessed"] == ["server2", "server1"]
 
 
 def test_before_tool_handles_non_host_tool():
     """Should handle tools that don't require host parameter."""
-    from core.callbacks import before_tool_callback
-
     tool = SimpleTool(name="some_other_tool")
     context = SimpleContext(
         {
             "investigation_context": {
                 "hosts_accessed": [],
                 "tools_used": [],
-                "start_time": time.time(),
+                "start_time": _CLOCK_START,
             }
         }
     )
@@ -384,8 +461,6 @@ def test_before_tool_handles_non_host_tool():
 
 def test_after_tool_detects_high_disk_usage():
     """Should flag high disk usage in session state."""
-    from core.callbacks import after_tool_callback
-
     tool = SimpleTool(name="get_disk_usage")
     context = SimpleContext()
     response = {"usage_percent": 95, "mount": "/"}
@@ -399,8 +474,6 @@ def test_after_tool_detects_high_disk_usage():
 
 def test_after_tool_detects_high_memory_usage():
     """Should flag high memory usage in session state."""
-    from core.callbacks import after_tool_callback
-
     tool = SimpleTool(name="get_memory_information")
     context = SimpleContext()
     response = {"percent_used": 92, "total_mb": 16384}
@@ -414,8 +487,6 @@ def test_after_tool_detects_high_memory_usage():
 
 def test_after_tool_ignores_normal_disk_usage():
     """Should not flag normal disk usage."""
-    from core.callbacks import after_tool_callback
-
     tool = SimpleTool(name="get_disk_usage")
     context = SimpleContext()
     response = {"usage_percent": 50}
@@ -427,8 +498,6 @@ def test_after_tool_ignores_normal_disk_usage():
 
 def test_after_tool_ignores_normal_memory_usage():
     """Should not flag normal memory usage."""
-    from core.callbacks import after_tool_callback
-
     tool = SimpleTool(name="get_memory_information")
     context = SimpleContext()
     response = {"percent_used": 65}
@@ -440,8 +509,6 @@ def test_after_tool_ignores_normal_memory_usage():
 
 def test_after_tool_handles_non_dict_response():
     """Should handle non-dict responses gracefully."""
-    from core.callbacks import after_tool_callback
-
     tool = SimpleTool(name="get_disk_usage")
     context = SimpleContext()
 
@@ -461,8 +528,6 @@ def test_after_tool_handles_non_dict_response():
 
 def test_create_callbacks_returns_all_callbacks():
     """Should return dict with all callback functions."""
-    from core.callbacks import create_callbacks_for_agent
-
     callbacks = create_callbacks_for_agent()
 
     assert isinstance(callbacks, dict)
@@ -474,18 +539,23 @@ def test_create_callbacks_returns_all_callbacks():
 
 def test_callbacks_are_callable():
     """All returned callbacks should be callable."""
-    from core.callbacks import create_callbacks_for_agent
-
     callbacks = create_callbacks_for_agent()
 
     for name, callback in callbacks.items():
         assert callable(callback), f"{name} should be callable"
 
 
+def test_create_callbacks_reuses_closures():
+    """Repeated calls should share callbacks but return independent dicts."""
+    first = create_callbacks_for_agent()
+    second = create_callbacks_for_agent()
+
+    assert first is not second
+    assert first["before_model_callback"] is second["before_model_callback"]
+
+
 def test_combined_before_model_callback():
     """Combined callback should run both rate limiting and validation."""
-    from core.callbacks import create_before_model_callback
-
     callback = create_before_model_callback()
     context = SimpleContext()
     request = SimpleLlmRequest()
@@ -499,14 +569,9 @@ def test_combined_before_model_callback():
 
 def test_combined_callback_validates_input():
     """Combined callback should detect dangerous patterns."""
-    from core.callbacks import create_before_model_callback
-
     callback = create_before_model_callback()
-    part = SimplePart(text="run rm -rf / now")
-    content = SimpleContent(parts=[part])
-    request = SimpleLlmRequest(contents=[content])
     context = SimpleContext()
 
-    callback(context, request)
+    callback(context, _req("run rm -rf / now"))
 
     assert "security_warning" in context.state
@@ -7,10 +7,28 @@ ADK integration tests are skipped in CI (require MCP server).
 
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 import yaml
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_AGENTS_DIR = _REPO_ROOT / "agents"
+_DEPLOY_DIR = _REPO_ROOT / "deploy"
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture(scope="session")
+def core_modules():
+    """Import the core package and its config module once per session."""
+    import core
+    import core.config
+
+    return SimpleNamespace(core=core, config=core.config, settings=core.config.settings)
+
+
 # =============================================================================
 # Test Configuration
 # =============================================================================
@@ -19,44 +37,40 @@ import yaml
 class TestSettings:
     """Tests for core configuration."""
 
-    def test_settings_loads(self):
+    def test_settings_loads(self, core_modules):
         """Settings should load without errors."""
-        from core.config import settings
+        settings = core_modules.settings
 
         assert settings is not None
 
-    def test_settings_has_defaults(self):
+    def test_settings_has_defaults(self, core_modules):
         """Settings should have sensible defaults."""
-        from core.config import settings
+        settings = core_modules.settings
 
         assert settings.DEFAULT_MODEL == "gemini-2.0-flash"
         assert settings.APP_NAME == "sysadmin-agents"
         assert settings.THINKING_BUDGET == 256
         assert settings.ENVIRONMENT in ("production", "staging", "development")
 
-    def test_get_mcp_env(self):
+    def test_get_mcp_env(self, core_modules):
         """get_mcp_env should return a dict with required keys."""
-        from core.config import settings
+        settings = core_modules.settings
 
         env = settings.get_mcp_env()
         assert isinstance(env, dict)
         assert "LINUX_MCP_LOG_LEVEL" in env
 
-    def test_model_constants(self):
+    def test_model_constants(self, core_modules):
         """Model constants should be defined correctly."""
-        from core.config import (
-            MODEL_CLAUDE_SONNET,
-            MODEL_GEMINI_2_0_FLASH,
-            MODEL_GPT_4O,
-        )
+        config = core_modules.config
 
-        assert MODEL_GEMINI_2_0_FLASH == "gemini-2.0-flash"
-        assert MODEL_GPT_4O == "openai/gpt-4o"
-        assert "anthropic" in MODEL_CLAUDE_SONNET
+        assert config.MODEL_GEMINI_2_0_FLASH == "gemini-2.0-flash"
+        assert config.MODEL_GPT_4O == "openai/gpt-4o"
+        assert "anthropic" in config.MODEL_CLAUDE_SONNET
 
-    def test_is_litellm_model(self):
+    def test_is_litellm_model(self, core_modules):
         """Should correctly identify LiteLLM models."""
-        from core.config import settings
+        settings = core_modules.settings
 
         # Native Gemini models
         assert not settings.is_litellm_model("gemini-2.0-flash")
@@ -67,31 +81,31 @@ class TestSettings:
         assert settings.is_litellm_model("anthropic/claude-sonnet-4-20250514")
         assert settings.is_litellm_model("azure/gpt-4")
 
-    def test_get_model_for_role(self):
+    def test_get_model_for_role(self, core_modules):
         """Should return correct model for role."""
-        from core.config import settings
+        settings = core_modules.settings
 
         # Default role
         model = settings.get_model("default")
         assert model == settings.DEFAULT_MODEL
 
-    def test_get_enabled_specialists(self):
+    def test_get_enabled_specialists(self, core_modules):
         """Should parse enabled specialists correctly."""
-        from core.config import settings
+        settings = core_modules.settings
 
         # By default, returns None (auto-discovery)
         if not settings.ENABLED_SPECIALISTS:
             assert settings.get_enabled_specialists() is None
 
-    def test_get_available_providers(self):
+    def test_get_available_providers(self, core_modules):
         """Should return provider availability dict."""
-        from core.config import settings
+        settings = core_modules.settings
 
         providers = settings.get_available_providers()
         assert "google" in providers
         assert "openai" in providers
         assert "anthropic" in providers
-        assert all(isinstance(v, bool) for v in providers.values())
+        assert set(map(type, providers.values())) == {bool}
 
 
 # =============================================================================
@@ -99,105 +113,70 @@ class TestSettings:
 # =============================================================================
 
 
-class TestRCAConfig:
-    """Tests for RCA specialist agent configuration (ADK Agent Config format)."""
-
-    @pytest.fixture
-    def config_path(self):
-        return Path(__file__).parent.parent / "agents" / "rca" / "root_agent.yaml"
-
-    def test_config_exists(self, config_path):
-        """RCA config should exist."""
-        assert config_path.exists(), f"Config not found: {config_path}"
-
-    def test_config_valid_yaml(self, config_path):
-        """RCA config should be valid YAML."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        assert config is not None
+class TestAgentConfig:
+    """Tests for specialist agent configurations (ADK Agent Config format)."""
 
-    def test_config_has_required_fields(self, config_path):
-        """RCA config should have all required fields (ADK flat format)."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+    # Specialist directory -> (agent name, output_key)
+    EXPECTED = {
+        "rca": ("rca_agent", "last_rca_report"),
+        "performance": ("performance_agent", "last_performance_report"),
+        "capacity": ("capacity_agent", "last_capacity_report"),
+    }
 
-        # ADK Agent Config uses flat structure
-        assert "name" in config, "Missing 'name'"
-        assert "model" in config, "Missing 'model'"
-        assert "description" in config, "Missing 'description'"
-        assert "instruction" in config, "Missing 'instruction'"
+    # Top-level keys every config needs (ADK Agent Config uses a flat structure)
+    REQUIRED_FIELDS = ("name", "model", "description", "instruction")
 
-    def test_config_instruction_not_empty(self, config_path):
-        """Instruction should be substantial."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+    @pytest.fixture(scope="class", params=list(EXPECTED))
+    @classmethod
+    def specialist(cls, request):
+        return request.param
 
-        instruction = config["instruction"]
-        assert len(instruction) > 100, "Instruction seems too short"
-
-    def test_config_has_output_key(self, config_path):
-        """RCA should have output_key for session state."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-
-        assert "output_key" in config, "Missing 'output_key'"
-        assert config["output_key"] == "last_rca_report"
+    @staticmethod
+    def _path_for(specialist):
+        return _AGENTS_DIR / specialist / "root_agent.yaml"
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def all_configs(cls):
+        """Parse every specialist config once."""
+        return {
+            specialist: yaml.load(cls._path_for(specialist).read_bytes(), Loader=_Loader)
+            for specialist in cls.EXPECTED
+        }
 
-class TestPerformanceConfig:
-    """Tests for Performance specialist agent configuration (ADK Agent Config format)."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config_path(cls, specialist):
+        return cls._path_for(specialist)
 
-    @pytest.fixture
-    def config_path(self):
-        return Path(__file__).parent.parent / "agents" / "performance" / "root_agent.yaml"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls, all_configs, specialist):
+        return all_configs[specialist]
 
     def test_config_exists(self, config_path):
-        """Performance config should exist."""
+        """Config should exist."""
         assert config_path.exists(), f"Config not found: {config_path}"
 
-    def test_config_valid_yaml(self, config_path):
-        """Performance config should be valid YAML."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+    def test_config_valid_yaml(self, config):
+        """Config should be valid YAML."""
         assert config is not None
 
-    def test_config_has_required_fields(self, config_path):
-        """Performance config should have all required fields (ADK flat format)."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+    def test_config_has_required_fields(self, config, specialist):
+        """Config should have all required fields (ADK flat format)."""
+        missing = [field for field in self.REQUIRED_FIELDS if field not in config]
+        assert not missing, f"Missing fields: {missing}"
+        assert config["name"] == self.EXPECTED[specialist][0]
 
-        # ADK Agent Config uses flat structure
-        assert "name" in config
-        assert config["name"] == "performance_agent"
-        assert "instruction" in config
-
-
-class TestCapacityConfig:
-    """Tests for Capacity specialist agent configuration (ADK Agent Config format)."""
-
-    @pytest.fixture
-    def config_path(self):
-        return Path(__file__).parent.parent / "agents" / "capacity" / "root_agent.yaml"
-
-    def test_config_exists(self, config_path):
-        """Capacity config should exist."""
-        assert config_path.exists(), f"Config not found: {config_path}"
-
-    def test_config_valid_yaml(self, config_path):
-        """Capacity config should be valid YAML."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        assert config is not None
-
-    def test_config_has_required_fields(self, config_path):
-        """Capacity config should have all required fields (ADK flat format)."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+    def test_config_instruction_not_empty(self, config):
+        """Instruction should be substantial."""
+        instruction = config["instruction"]
+        assert len(instruction) > 100, "Instruction seems too short"
 
-        # ADK Agent Config uses flat structure
-        assert "name" in config
-        assert config["name"] == "capacity_agent"
-        assert "instruction" in config
+    def test_config_has_output_key(self, config, specialist):
+        """Specialist should have output_key for session state."""
+        assert "output_key" in config, "Missing 'output_key'"
+        assert config["output_key"] == self.EXPECTED[specialist][1]
 
 
 # =============================================================================
@@ -208,33 +187,33 @@ class TestCapacityConfig:
 class TestPackageStructure:
     """Tests for package structure and imports."""
 
-    def test_core_package_imports(self):
+    def test_core_package_imports(self, core_modules):
         """Core package should export settings."""
-        from core import Settings, settings
-
-        assert settings is not None
-        assert Settings is not None
+        assert core_modules.core.settings is not None
+        assert core_modules.core.Settings is not None
 
     def test_agents_directory_exists(self):
         """Agents directory should exist with expected structure."""
-        agents_dir = Path(__file__).parent.parent / "agents"
-        assert agents_dir.exists()
+        assert _AGENTS_DIR.exists()
+
+        # Check expected agent directories, listing each directory once
+        with os.scandir(_AGENTS_DIR) as it:
+            agent_dirs = {entry.name for entry in it if entry.is_dir()}
 
-        # Check expected agent directories
         expected_agents = ["rca", "performance", "capacity", "upgrade", "sysadmin"]
         for agent_name in expected_agents:
-            agent_dir = agents_dir / agent_name
-            assert agent_dir.exists(), f"Missing agent directory: {agent_name}"
-            assert (agent_dir / "__init__.py").exists(), f"Missing __init__.py in {agent_name}"
-            assert (agent_dir / "agent.py").exists(), f"Missing agent.py in {agent_name}"
+            assert agent_name in agent_dirs, f"Missing agent directory: {agent_name}"
+            with os.scandir(_AGENTS_DIR / agent_name) as it:
+                files = {entry.name for entry in it}
+            assert "__init__.py" in files, f"Missing __init__.py in {agent_name}"
+            assert "agent.py" in files, f"Missing agent.py in {agent_name}"
 
     def test_each_specialist_has_config(self):
         """Each specialist should have a root_agent.yaml (ADK Agent Config format)."""
-        agents_dir = Path(__file__).parent.parent / "agents"
         specialists = ["rca", "performance", "capacity", "upgrade"]
 
         for specialist in specialists:
-            config_path = agents_dir / specialist / "root_agent.yaml"
+            config_path = _AGENTS_DIR / specialist / "root_agent.yaml"
             assert config_path.exists(), f"Missing root_agent.yaml for {specialist}"
 
 
@@ -254,6 +233,12 @@ class TestADKIntegration:
     and are skipped in CI environments.
     """
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _require_adk(cls):
+        """Skip the whole class up front when google-adk is not installed."""
+        pytest.importorskip("google.adk")
+
     def test_sysadmin_agent_created(self):
         """Sysadmin agent should be created with sub-agents."""
         try:
@@ -290,25 +275,26 @@ class TestDeploymentFiles:
 
     def test_deployment_yaml_exists(self):
         """Deployment YAML should exist."""
-        deploy_path = Path(__file__).parent.parent / "deploy" / "deployment.yaml"
+        deploy_path = _DEPLOY_DIR / "deployment.yaml"
         assert deploy_path.exists()
 
     def test_service_yaml_exists(self):
         """Service YAML should exist."""
-        service_path = Path(__file__).parent.parent / "deploy" / "service.yaml"
+        service_path = _DEPLOY_DIR / "service.yaml"
         assert service_path.exists()
 
     def test_kustomization_yaml_exists(self):
         """Kustomization YAML should exist."""
-        kustomize_path = Path(__file__).parent.parent / "deploy" / "kustomization.yaml"
+        kustomize_path = _DEPLOY_DIR / "kustomization.yaml"
         assert kustomize_path.exists()
 
     def test_deployment_yaml_valid(self):
         """Deployment YAML should be valid."""
-        deploy_path = Path(__file__).parent.parent / "deploy" / "deployment.yaml"
-        with open(deploy_path) as f:
-            docs = list(yaml.safe_load_all(f))
-        assert len(docs) > 0
+        deploy_path = _DEPLOY_DIR / "deployment.yaml"
+        # Stream the documents rather than collecting them; every document
+        # still has to parse for the file to count as valid
+        doc_count = sum(1 for _ in yaml.load_all(deploy_path.read_bytes(), Loader=_Loader))
+        assert doc_count > 0
 
 
 # =============================================================================
@@ -319,24 +305,28 @@ class TestDeploymentFiles:
 class TestProjectConfig:
     """Tests for project configuration."""
 
-    @pytest.fixture
-    def pyproject_path(self):
-        return Path(__file__).parent.parent / "pyproject.toml"
+    @pytest.fixture(scope="session")
+    @classmethod
+    def pyproject_path(cls):
+        return _REPO_ROOT / "pyproject.toml"
+
+    @pytest.fixture(scope="session")
+    @classmethod
+    def pyproject_text(cls, pyproject_path):
+        """Read pyproject.toml once per session."""
+        return pyproject_path.read_text()
 
     def test_pyproject_exists(self, pyproject_path):
         """pyproject.toml should exist."""
         assert pyproject_path.exists()
 
-    def test_required_dependencies(self, pyproject_path):
+    def test_required_dependencies(self, pyproject_text):
         """Should have required dependencies."""
-        content = pyproject_path.read_text()
-        assert "google-adk" in content
-        assert "linux-mcp-server" in content
-        assert "pyyaml" in content
-        assert "pydantic-settings" in content
+        deps = ("google-adk", "linux-mcp-server", "pyyaml", "pydantic-settings")
+        missing = [dep for dep in deps if dep not in pyproject_text]
+        assert not missing, f"Missing dependencies: {missing}"
 
-    def test_dev_dependencies(self, pyproject_path):
+    def test_dev_dependencies(self, pyproject_text):
         """Should have dev dependencies."""
-        content = pyproject_path.read_text()
-        assert "pytest" in content
-        assert "ruff" in content
+        missing = [dep for dep in ("pytest", "ruff") if dep not in pyproject_text]
+        assert not missing, f"Missing dev dependencies: {missing}"
@@ -14,9 +14,11 @@
 
 """Tests for the events module."""
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from typing import Any
 
+from core import events as events_module
 from core.events import (
     EventAccumulator,
     EventType,
@@ -30,7 +32,7 @@ from core.events import (
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MockPart:
     """Mock content part."""
 
@@ -39,7 +41,7 @@ class MockPart:
     function_response: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MockContent:
     """Mock content with parts."""
 
@@ -47,7 +49,7 @@ class MockContent:
     role: str = "model"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockFunctionCall:
     """Mock function call."""
 
@@ -55,7 +57,7 @@ class MockFunctionCall:
     args: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class MockFunctionResponse:
     """Mock function response."""
 
@@ -63,7 +65,7 @@ class MockFunctionResponse:
     response: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class MockActions:
     """Mock event actions."""
 
@@ -74,7 +76,7 @@ class MockActions:
     skip_summarization: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MockEvent:
     """Mock ADK event for testing."""
 
@@ -86,29 +88,35 @@ class MockEvent:
     actions: MockActions | None = None
     error_code: str | None = None
     error_message: str | None = None
+    # Derived from content in one pass in __post_init__; mocks are not mutated later
+    _function_calls: list = field(init=False, repr=False, compare=False)
+    _function_responses: list = field(init=False, repr=False, compare=False)
+    _has_text: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._function_calls = []
+        self._function_responses = []
+        self._has_text = False
+        for p in (self.content.parts if self.content else None) or []:
+            if p.function_call:
+                self._function_calls.append(p.function_call)
+            if p.function_response:
+                self._function_responses.append(p.function_response)
+            if p.text:
+                self._has_text = True
 
     def get_function_calls(self):
-        if not self.content or not self.content.parts:
-            return []
-        return [p.function_call for p in self.content.parts if p.function_call]
+        return self._function_calls
 
     def get_function_responses(self):
-        if not self.content or not self.content.parts:
-            return []
-        return [p.function_response for p in self.content.parts if p.function_response]
+        return self._function_responses
 
     def is_final_response(self):
-        if self.partial:
+        if self.partial or self._function_calls:
             return False
-        if self.get_function_calls():
-            return False
-        if self.get_function_responses():
-            if self.actions and self.actions.skip_summarization:
-                return True
-            return False
-        if self.content and any(p.text for p in (self.content.parts or [])):
-            return True
-        return False
+        if self._function_responses:
+            return bool(self.actions and self.actions.skip_summarization)
+        return self._has_text
 
 
 # =============================================================================
@@ -329,12 +337,32 @@ class TestEventAccumulator:
                 ]
             ),
         )
-        accumulator.add(tool_event)
+        info = accumulator.add(tool_event)
 
+        assert accumulator.events[-1] is info
         assert len(accumulator.tool_calls) == 1
         assert accumulator.tool_calls[0]["name"] == "get_disk_usage"
         assert accumulator.tool_calls[0]["args"] == {"host": "server1"}
 
+    def test_add_classifies_event_once(self, monkeypatch):
+        """Should classify each event exactly once and reuse the result."""
+        calls = []
+
+        def counting_classify(event):
+            calls.append(event)
+            return classify_event(event)
+
+        monkeypatch.setattr(events_module, "classify_event", counting_classify)
+        event = MockEvent(
+            author="agent",
+            content=MockContent(parts=[MockPart(text="Done")]),
+            actions=MockActions(state_delta={"key": "value"}),
+        )
+
+        EventAccumulator().add(event)
+
+        assert calls == [event]
+
     def test_track_tool_results(self):
         """Should track tool results."""
         accumulator = EventAccumulator()
@@ -411,6 +439,21 @@ class TestLogging:
         assert info.event_type == EventType.AGENT_TEXT
         assert info.text == "Test response"
 
+    def test_log_event_formats_only_when_enabled(self, caplog):
+        """Should emit a formatted line only when the level is enabled."""
+        event = MockEvent(
+            author="sysadmin",
+            content=MockContent(parts=[MockPart(text="Test response")]),
+        )
+
+        caplog.set_level(logging.INFO, logger="core.events")
+        log_event(event)
+        assert caplog.records == []
+
+        caplog.set_level(logging.DEBUG, logger="core.events")
+        log_event(event)
+        assert caplog.records[-1].getMessage().startswith("[agent_text] author=sysadmin")
+
     def test_format_event_summary(self):
         """Should format event summary."""
         event = MockEvent(
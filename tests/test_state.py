@@ -16,6 +16,8 @@
 
 import time
 
+import pytest
+
 from core.state import (
     InvestigationContext,
     StateKeys,
@@ -188,6 +190,23 @@ class TestStateManager:
         temp_state = manager.get_temp_state()
         assert temp_state == {"timer": 123.456, "count": 5}
 
+    def test_get_state_by_scope(self):
+        """Should split state into every scope, matching the per-scope getters."""
+        state = {
+            "session_key": "session_value",
+            "host:web01": "up",
+            "user:theme": "dark",
+            "app:version": "1.0",
+            "temp:count": 5,
+        }
+        manager = StateManager(state)
+
+        scopes = manager.get_state_by_scope()
+        assert scopes[""] == manager.get_session_state()
+        assert scopes[StatePrefix.USER] == manager.get_user_state()
+        assert scopes[StatePrefix.APP] == manager.get_app_state()
+        assert scopes[StatePrefix.TEMP] == manager.get_temp_state()
+
 
 class TestInvestigationContext:
     """Tests for InvestigationContext dataclass."""
@@ -200,6 +219,13 @@ class TestInvestigationContext:
         assert context.warnings == []
         assert context.findings == []
 
+    def test_uses_slots(self):
+        """Context should not carry a per-instance __dict__."""
+        context = InvestigationContext()
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.extra = "value"
+
     def test_add_host(self):
         """Should add hosts without duplicates."""
         context = InvestigationContext()
@@ -214,6 +240,24 @@ class TestInvestigationContext:
         context.add_host("server1")
         assert context.hosts_accessed == ["server1", "server2"]
 
+    def test_add_host_after_direct_list_edit(self):
+        """Should still deduplicate when hosts_accessed is modified directly."""
+        context = InvestigationContext.from_dict({"hosts_accessed": ["server1"]})
+
+        context.hosts_accessed.append("server2")
+        context.add_host("server2")
+        context.add_host("server1")
+        assert context.hosts_accessed == ["server1", "server2"]
+
+    def test_add_host_after_same_length_list_edit(self):
+        """Should not drop a host when an entry was replaced in place."""
+        context = InvestigationContext()
+
+        context.add_host("server1")
+        context.hosts_accessed[0] = "server2"
+        context.add_host("server1")
+        assert context.hosts_accessed == ["server2", "server1"]
+
     def test_add_tool_usage(self):
         """Should track tool usage."""
         context = InvestigationContext()
@@ -310,6 +354,20 @@ class TestStateInitialization:
         assert state[StateKeys.INVESTIGATION_CONTEXT] == existing_context
         assert state[StateKeys.SESSION_START] == 12345.0
 
+    def test_initialize_fills_missing_key_only(self):
+        """Should initialize only the key that is missing and share one start time."""
+        state = {StateKeys.SESSION_START: 12345.0}
+
+        initialize_session_state(state)
+
+        assert state[StateKeys.SESSION_START] == 12345.0
+        assert StateKeys.INVESTIGATION_CONTEXT in state
+
+        fresh = {}
+        initialize_session_state(fresh)
+        context_start = fresh[StateKeys.INVESTIGATION_CONTEXT]["start_time"]
+        assert context_start == fresh[StateKeys.SESSION_START]
+
     def test_get_investigation_context(self):
         """Should get investigation context from state."""
         state = {